@@ -20,21 +20,24 @@ import enum
 import random
 import math
 import time
-from collections import deque, defaultdict
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from itertools import accumulate
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
-import csv
 import os
+import sys
 import colorsys
-import hashlib
+from statistics import fmean
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-import matplotlib
-matplotlib.use("TkAgg")
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+# Sin pantalla (o con --headless) se corren los escenarios en modo batch, sin ventana.
+SIN_INTERFAZ = "--headless" in sys.argv or (
+    sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+)
 
 
 # ===========================
@@ -49,7 +52,16 @@ class Estado(enum.Enum):
     TERMINADO = "Terminado"
 
 
-@dataclass
+# Alias a nivel de módulo para el camino caliente: leer un miembro del Enum
+# (Estado.X) es varias veces más lento que una variable global
+_NUEVO = Estado.NUEVO
+_LISTO = Estado.LISTO
+_EJECUTANDO = Estado.EJECUTANDO
+_BLOQUEADO = Estado.BLOQUEADO
+_TERMINADO = Estado.TERMINADO
+
+
+@dataclass(slots=True)
 class Proceso:
     pid: int
     llegada: int
@@ -58,6 +70,7 @@ class Proceso:
     cpu_restante: int = field(init=False)
     estado: Estado = field(default=Estado.NUEVO)
     espera_acumulada: int = 0
+    listo_desde: int = 0  # tick del planificador en que entró a la cola de listos
     tiempo_fin: Optional[int] = None
     # CONTIGUA
     bloque_asignado: Optional[Tuple[int, int]] = None
@@ -75,7 +88,7 @@ class Proceso:
 # Memoria contigua
 # ===========================
 
-@dataclass
+@dataclass(slots=True)
 class Hueco:
     inicio: int
     tamanio: int
@@ -91,81 +104,172 @@ class MemoriaContigua:
     def __init__(self, total: int, asignador: Asignador):
         self.total = total
         self.asignador = asignador
-        self.huecos: List[Hueco] = [Hueco(0, total)]
+        # La estrategia se resuelve una sola vez, no en cada asignación
+        self._buscar_hueco = {
+            Asignador.PRIMER_AJUSTE: self._buscar_primer,
+            Asignador.MEJOR_AJUSTE: self._buscar_mejor,
+            Asignador.PEOR_AJUSTE: self._buscar_peor,
+        }[asignador]
+        # Huecos como estructura de arrays paralelos (SoA), ordenados por inicio
+        self._hole_start: List[int] = [0]
+        self._hole_size: List[int] = [total]
+        # Índice de los mismos huecos ordenado por (tamaño, inicio): el mejor y el peor ajuste
+        # salen por bisección (argmin/argmax) y el mayor hueco es el último elemento
+        self._por_tamanio: List[Tuple[int, int]] = [(total, 0)]
         self.asignaciones: dict[int, Tuple[int, int]] = {}
-        self.hist_uso: List[float] = []
-        self.hist_frag: List[float] = []
+        self._usado = 0
+        # Se incrementa en cada cambio del mapa (asignar/liberar/compactar): permite cachear vistas
+        self.version = 0
+        # Historial por tick en buffers compactos de doubles (sin boxing por elemento)
+        self.hist_uso: array = array("d")
+        self.hist_frag: array = array("d")
+
+    @property
+    def huecos(self) -> List[Hueco]:
+        # Vista de solo lectura de los huecos, en orden de dirección
+        return [Hueco(i, t) for i, t in zip(self._hole_start, self._hole_size)]
+
+    # Los huecos están ordenados por inicio: el menor índice es la menor dirección
+    def _buscar_primer(self, tamanio: int) -> Optional[int]:
+        for i, t in enumerate(self._hole_size):
+            if t >= tamanio:
+                return i
+        return None
+
+    # Mejor/peor ajuste: el primer (tamaño, inicio) del índice que cumple da el tamaño
+    # buscado con desempate por menor dirección; se traduce a posición por inicio
+    def _buscar_mejor(self, tamanio: int) -> Optional[int]:
+        k = bisect_left(self._por_tamanio, (tamanio, -1))
+        if k == len(self._por_tamanio):
+            return None
+        return bisect_left(self._hole_start, self._por_tamanio[k][1])
 
-    def _buscar_hueco(self, tamanio: int) -> Optional[int]:
-        candidatos = [(i, h.inicio, h.tamanio) for i, h in enumerate(self.huecos) if h.tamanio >= tamanio]
-        if not candidatos:
+    def _buscar_peor(self, tamanio: int) -> Optional[int]:
+        mayor = self.mayor_hueco()
+        if not self._hole_size or mayor < tamanio:
             return None
+        k = bisect_left(self._por_tamanio, (mayor, -1))
+        return bisect_left(self._hole_start, self._por_tamanio[k][1])
 
+    def _buscar_lineal(self, tamanio: int) -> Optional[int]:
+        # Recorrido completo con el mismo criterio y desempate que las búsquedas rápidas
+        candidatos = [(i, ini, t) for i, (ini, t) in enumerate(zip(self._hole_start, self._hole_size))
+                      if t >= tamanio]
+        if not candidatos:
+            return None
         if self.asignador == Asignador.PRIMER_AJUSTE:
             return candidatos[0][0]
-
         if self.asignador == Asignador.MEJOR_AJUSTE:
-            # Best-fit con desempate estable por menor dirección
-            i, _, _ = min(candidatos, key=lambda x: (x[2], x[1]))
-            return i
+            return min(candidatos, key=lambda x: (x[2], x[1]))[0]
+        return max(candidatos, key=lambda x: (x[2], -x[1]))[0]
+
+    def _quitar_indice(self, inicio: int, tamanio: int):
+        orden = self._por_tamanio
+        del orden[bisect_left(orden, (tamanio, inicio))]
 
-        # Peor-ajuste con desempate estable por menor dirección
-        i, _, _ = max(candidatos, key=lambda x: (x[2], -x[1]))
-        return i
+    def mayor_hueco(self) -> int:
+        return self._por_tamanio[-1][0] if self._por_tamanio else 0
 
     def asignar(self, pid: int, tamanio: int) -> Optional[Tuple[int, int]]:
-        idx = self._buscar_hueco(tamanio)
+        # Rechazo en O(1) si ningún hueco alcanza (caso típico de los reintentos pendientes)
+        if self.mayor_hueco() < tamanio:
+            return None
+        # Con huecos vacíos la lista puede repetir inicios: las bisecciones no aplican
+        idx = self._buscar_lineal(tamanio) if self._hay_huecos_vacios() else self._buscar_hueco(tamanio)
         if idx is None:
             return None
-        hueco = self.huecos[idx]
-        inicio = hueco.inicio
+        inicio = self._hole_start[idx]
         self.asignaciones[pid] = (inicio, tamanio)
-        hueco.inicio += tamanio
-        hueco.tamanio -= tamanio
-        if hueco.tamanio == 0:
-            self.huecos.pop(idx)
+        self._usado += tamanio
+        self.version += 1
+        self._quitar_indice(inicio, self._hole_size[idx])
+        self._hole_start[idx] += tamanio
+        self._hole_size[idx] -= tamanio
+        if self._hole_size[idx] == 0:
+            self._hole_start.pop(idx)
+            self._hole_size.pop(idx)
+        else:
+            insort(self._por_tamanio, (self._hole_size[idx], self._hole_start[idx]))
         return (inicio, tamanio)
 
     def liberar(self, pid: int):
         if pid not in self.asignaciones:
             return
         inicio, tamanio = self.asignaciones.pop(pid)
-        self.huecos.append(Hueco(inicio, tamanio))
-        self.huecos.sort(key=lambda h: h.inicio)
-        fusionados: List[Hueco] = []
-        for h in self.huecos:
-            if not fusionados:
-                fusionados.append(h)
+        self._usado -= tamanio
+        self.version += 1
+        if tamanio == 0 or self._hay_huecos_vacios():
+            self._liberar_con_vacios(inicio, tamanio)
+            return
+        starts, sizes = self._hole_start, self._hole_size
+        # Los huecos ya están fusionados: solo pueden unirse los vecinos inmediatos
+        idx = bisect_left(starts, inicio)
+        une_izq = idx > 0 and starts[idx - 1] + sizes[idx - 1] == inicio
+        une_der = idx < len(starts) and inicio + tamanio == starts[idx]
+        if une_izq:
+            self._quitar_indice(starts[idx - 1], sizes[idx - 1])
+        if une_der:
+            self._quitar_indice(starts[idx], sizes[idx])
+        if une_izq and une_der:
+            sizes[idx - 1] += tamanio + sizes[idx]
+            starts.pop(idx)
+            sizes.pop(idx)
+            idx -= 1
+        elif une_izq:
+            idx -= 1
+            sizes[idx] += tamanio
+        elif une_der:
+            starts[idx] = inicio
+            sizes[idx] += tamanio
+        else:
+            starts.insert(idx, inicio)
+            sizes.insert(idx, tamanio)
+        insort(self._por_tamanio, (sizes[idx], starts[idx]))
+
+    def _hay_huecos_vacios(self) -> bool:
+        # El índice está ordenado por tamaño: si hay huecos de tamaño 0, el primero lo es
+        return bool(self._por_tamanio) and self._por_tamanio[0][0] == 0
+
+    def _liberar_con_vacios(self, inicio: int, tamanio: int):
+        # Bloques de tamaño 0 (memorias muy chicas): dejan huecos vacíos que pueden repetir
+        # inicio, y la fusión por vecinos deja de valer. Caso raro: se reordena y fusiona
+        # toda la lista (orden estable por inicio), como la versión original
+        huecos = sorted(zip(self._hole_start + [inicio], self._hole_size + [tamanio]), key=lambda h: h[0])
+        starts: List[int] = []
+        sizes: List[int] = []
+        for i, t in huecos:
+            if starts and starts[-1] + sizes[-1] == i:
+                sizes[-1] += t
             else:
-                ultimo = fusionados[-1]
-                if ultimo.inicio + ultimo.tamanio == h.inicio:
-                    ultimo.tamanio += h.tamanio
-                else:
-                    fusionados.append(h)
-        self.huecos = fusionados
+                starts.append(i)
+                sizes.append(t)
+        self._hole_start, self._hole_size = starts, sizes
+        self._por_tamanio = sorted(zip(sizes, starts))
 
     def compactar(self):
         # Desplaza todo al inicio para eliminar fragmentación externa
-        asign_orden = sorted([(pid, i, t) for pid, (i, t) in self.asignaciones.items()],
-                             key=lambda x: x[1])
-        actual = 0
-        nuevas = {}
-        for pid, _, tam in asign_orden:
-            nuevas[pid] = (actual, tam)
-            actual += tam
-        self.asignaciones = nuevas
-        self.huecos = [Hueco(actual, self.total - actual)]
+        asign = self.asignaciones
+        orden = sorted(asign, key=lambda pid: asign[pid][0])
+        tams = [asign[pid][1] for pid in orden]
+        # Nuevos inicios = suma acumulada de tamaños (el excedente final se ignora en zip)
+        self.asignaciones = dict(zip(orden, zip(accumulate(tams, initial=0), tams)))
+        actual = self._usado
+        self._hole_start = [actual]
+        self._hole_size = [self.total - actual]
+        self._por_tamanio = [(self.total - actual, actual)]
+        self.version += 1
+
+    def memoria_libre(self) -> int:
+        return self.total - self._usado
 
     def proporcion_uso(self) -> float:
-        usado = sum(t for _, t in self.asignaciones.values())
-        return usado / self.total if self.total else 0.0
+        return self._usado / self.total if self.total else 0.0
 
     def grado_fragmentacion(self) -> float:
-        libre = sum(h.tamanio for h in self.huecos)
+        libre = self.memoria_libre()
         if libre == 0:
             return 0.0
-        mayor = max((h.tamanio for h in self.huecos), default=0)
-        return 1.0 - (mayor / libre)
+        return 1.0 - (self.mayor_hueco() / libre)
 
     def tick_metricas(self):
         self.hist_uso.append(self.proporcion_uso())
@@ -182,11 +286,15 @@ class MemoriaPaginacion:
         self.tamanio_pagina = tamanio_pagina
         self.cant_marcos = max(1, total // tamanio_pagina)
         self.marcos: List[Optional[Tuple[int, int]]] = [None] * self.cant_marcos
-        self.marcos_libres: set[int] = set(range(self.cant_marcos))
+        # Pila/cola de marcos libres: O(1) sin hashing; un marco aparece a lo sumo una vez
+        self.marcos_libres: deque[int] = deque(range(self.cant_marcos))
+        self._usados = 0
         self.usar_fifo = reemplazo_fifo
         self.cola_fifo: deque[int] = deque()
-        self.hist_uso: List[float] = []
+        self.hist_uso: array = array("d")
         self.fallos_pagina: int = 0
+        # Igual que en MemoriaContigua: cambia con cada carga/liberación de marcos
+        self.version = 0
 
     def asignar(self, proc: Proceso) -> bool:
         necesarias = len(proc.paginas)
@@ -194,14 +302,16 @@ class MemoriaPaginacion:
             if proc.marcos[idx_pag] is not None:
                 continue
             if self.marcos_libres:
-                marco = self.marcos_libres.pop()
+                marco = self.marcos_libres.popleft()
             elif self.usar_fifo:
-                victima = self.cola_fifo.popleft()
-                self.marcos[victima] = None
-                marco = victima
+                # El marco víctima se reutiliza: no cambia la cantidad de marcos usados
+                marco = self.cola_fifo.popleft()
             else:
                 return False
+            if self.marcos[marco] is None:
+                self._usados += 1
             self.marcos[marco] = (proc.pid, idx_pag)
+            self.version += 1
             proc.marcos[idx_pag] = marco
             if self.usar_fifo:
                 self.cola_fifo.append(marco)
@@ -211,13 +321,16 @@ class MemoriaPaginacion:
     def liberar(self, proc: Proceso):
         for m in proc.marcos:
             if m is not None and 0 <= m < self.cant_marcos:
-                self.marcos[m] = None
-                self.marcos_libres.add(m)
+                # Solo se devuelve a la lista si estaba ocupado (evita duplicados)
+                if self.marcos[m] is not None:
+                    self._usados -= 1
+                    self.marcos[m] = None
+                    self.marcos_libres.append(m)
+                    self.version += 1
         proc.marcos = [None for _ in proc.paginas]
 
     def proporcion_uso(self) -> float:
-        usados = sum(1 for x in self.marcos if x is not None)
-        return usados / self.cant_marcos if self.cant_marcos else 0.0
+        return self._usados / self.cant_marcos if self.cant_marcos else 0.0
 
     def tick_metricas(self):
         self.hist_uso.append(self.proporcion_uso())
@@ -255,38 +368,45 @@ class PlanificadorRR:
         self.listos: deque[Proceso] = deque()
         self.ejecutando: Optional[Proceso] = None
         self.bloqueados: deque[Proceso] = deque()
+        # Ticks transcurridos; la espera se acredita al salir de listos, no en cada tick
+        self.reloj = 0
 
-    def admitir(self, p: Proceso):
-        if p.estado == Estado.NUEVO:
-            p.estado = Estado.LISTO
+    def _encolar_listo(self, p: Proceso):
+        p.listo_desde = self.reloj
         self.listos.append(p)
 
+    def admitir(self, p: Proceso):
+        if p.estado is _NUEVO:
+            p.estado = _LISTO
+        self._encolar_listo(p)
+
     def bloquear(self, p: Proceso):
-        p.estado = Estado.BLOQUEADO
+        p.estado = _BLOQUEADO
         self.bloqueados.append(p)
         self.ejecutando = None
         self.quantum_actual = 0
 
     def desbloquear(self, p: Proceso):
-        p.estado = Estado.LISTO
-        self.listos.append(p)
+        p.estado = _LISTO
+        self._encolar_listo(p)
 
     def desalojar_si_corresponde(self):
         if self.ejecutando and self.quantum_actual >= self.quantum:
-            self.ejecutando.estado = Estado.LISTO
-            self.listos.append(self.ejecutando)
+            self.ejecutando.estado = _LISTO
+            self._encolar_listo(self.ejecutando)
             self.ejecutando = None
             self.quantum_actual = 0
 
     def planificar(self):
         if not self.ejecutando and self.listos:
-            self.ejecutando = self.listos.popleft()
-            self.ejecutando.estado = Estado.EJECUTANDO
+            p = self.listos.popleft()
+            p.espera_acumulada += self.reloj - p.listo_desde
+            p.estado = _EJECUTANDO
+            self.ejecutando = p
             self.quantum_actual = 0
 
     def tick(self):
-        for p in self.listos:
-            p.espera_acumulada += 1
+        self.reloj += 1
         if self.ejecutando:
             self.quantum_actual += 1
 
@@ -298,21 +418,27 @@ class PlanificadorRR:
 class Simulador:
     def __init__(self, memoria_total: int, modo: str, asignador: str = "primer", tamanio_pagina: int = 64,
                  quantum: int = 3, ticks: int = 200, stress: int = 15, semilla: int = 42, reemplazo_fifo: bool = False):
-        random.seed(semilla)
+        # Generador propio: misma secuencia que random.seed(semilla) sin tocar el estado global
+        self._rng = random.Random(semilla)
         self.ticks = ticks
         self.ahora = 0
         self.modo = modo.upper()
         self.planificador = PlanificadorRR(quantum=quantum)
         self.impresora = Impresora()
         self.procesos: List[Proceso] = []
-        self.llegadas: defaultdict[int, List[Proceso]] = defaultdict(list)
+        # Procesos ordenados por llegada + puntero al próximo por llegar
+        self._por_llegada: List[Proceso] = []
+        self._idx_llegada = 0
+        # NUEVOs que llegaron pero no entraron en memoria, ordenados por PID
+        self.pendientes: List[Proceso] = []
         self.finalizados: List[Proceso] = []
         self.mem_contigua: Optional[MemoriaContigua] = None
         self.mem_paginada: Optional[MemoriaPaginacion] = None
 
-        self.hist_uso_pct: List[float] = []
-        self.hist_frag: List[float] = []
-        self.hist_fallos: List[int] = []
+        # La simulación puede extenderse más allá de `ticks` (corre hasta terminar),
+        # por eso se usan arrays tipados que crecen en vez de un buffer de tamaño fijo.
+        # Uso y fragmentación se leen directamente del historial de la memoria activa.
+        self.hist_fallos: array = array("q")
 
         if self.modo == "CONTIGUA":
             mapa = {"primer": Asignador.PRIMER_AJUSTE, "mejor": Asignador.MEJOR_AJUSTE, "peor": Asignador.PEOR_AJUSTE}
@@ -325,18 +451,23 @@ class Simulador:
         self._generar_procesos(stress=stress, memoria_total=memoria_total, tamanio_pagina=tamanio_pagina)
 
     def _generar_procesos(self, stress: int, memoria_total: int, tamanio_pagina: int):
+        randint, choice = self._rng.randint, self._rng.choice
+        max_llegada = max(1, self.ticks // 4)
+        dem_min, dem_max = int(0.05 * memoria_total), int(0.30 * memoria_total)
+        paginacion = self.modo == "PAGINACION"
         for pid in range(1, stress + 1):
-            llegada = random.randint(0, max(1, self.ticks // 4))
-            duracion = random.randint(5, 20)
-            demanda = random.randint(int(0.05 * memoria_total), int(0.30 * memoria_total))
+            llegada = randint(0, max_llegada)
+            duracion = randint(5, 20)
+            demanda = randint(dem_min, dem_max)
             p = Proceso(pid=pid, llegada=llegada, duracion=duracion, demanda_mem=demanda)
-            p.proximo_io_en = random.choice([None, duracion // 2, duracion // 3])
-            if self.modo == "PAGINACION":
+            p.proximo_io_en = choice([None, duracion // 2, duracion // 3])
+            if paginacion:
                 paginas = max(1, math.ceil(p.demanda_mem / tamanio_pagina))
                 p.paginas = list(range(paginas))
                 p.marcos = [None] * paginas
             self.procesos.append(p)
-            self.llegadas[llegada].append(p)
+        # sorted es estable: a igual llegada se respeta el orden por PID
+        self._por_llegada = sorted(self.procesos, key=lambda x: x.llegada)
 
     def _intentar_admitir_memoria(self, p: Proceso) -> bool:
         if self.modo == "CONTIGUA":
@@ -359,26 +490,42 @@ class Simulador:
 
     def paso(self):
         # 1) Llegadas
-        for p in self.llegadas.get(self.ahora, []):
-            if self._intentar_admitir_memoria(p):
-                self.planificador.admitir(p)
-
-        # 2) Reintentos de NUEVO
-        for p in [x for x in self.procesos if x.estado == Estado.NUEVO and x.llegada <= self.ahora]:
+        rechazados = []
+        por_llegada = self._por_llegada
+        while self._idx_llegada < len(por_llegada) and por_llegada[self._idx_llegada].llegada <= self.ahora:
+            p = por_llegada[self._idx_llegada]
+            self._idx_llegada += 1
             if self._intentar_admitir_memoria(p):
                 self.planificador.admitir(p)
-
-        # 3) Desbloqueos por I/O
-        a_desbloquear = []
-        for p in list(self.planificador.bloqueados):
+            else:
+                rechazados.append(p)
+
+        # 2) Reintentos de NUEVO (solo los pendientes; la memoria no crece entre
+        #    1 y 2, así que los recién rechazados no necesitan reintentarse)
+        if self.pendientes:
+            quedan = []
+            for p in self.pendientes:
+                if self._intentar_admitir_memoria(p):
+                    self.planificador.admitir(p)
+                else:
+                    quedan.append(p)
+            self.pendientes = quedan
+        for p in rechazados:
+            insort(self.pendientes, p, key=lambda x: x.pid)
+
+        # 3) Desbloqueos por I/O (una sola pasada, sin deque.remove)
+        bloqueados = self.planificador.bloqueados
+        siguen_bloq: deque[Proceso] = deque()
+        while bloqueados:
+            p = bloqueados.popleft()
             if p.proximo_io_en is not None and p.proximo_io_en < 0:
                 p.proximo_io_en += 1
                 if p.proximo_io_en == 0:
-                    a_desbloquear.append(p)
-        for p in a_desbloquear:
-            self.planificador.bloqueados.remove(p)
-            self.planificador.desbloquear(p)
-            self.impresora.liberar()
+                    self.planificador.desbloquear(p)
+                    self.impresora.liberar()
+                    continue
+            siguen_bloq.append(p)
+        self.planificador.bloqueados = siguen_bloq
 
         # 4) Planificación
         self.planificador.desalojar_si_corresponde()
@@ -394,7 +541,7 @@ class Simulador:
             else:
                 p.cpu_restante -= 1
                 if p.cpu_restante <= 0:
-                    p.estado = Estado.TERMINADO
+                    p.estado = _TERMINADO
                     p.tiempo_fin = self.ahora
                     self._liberar_memoria(p)
                     self.finalizados.append(p)
@@ -404,16 +551,25 @@ class Simulador:
         # 6) Métricas por tick
         if self.modo == "CONTIGUA":
             self.mem_contigua.tick_metricas()
-            self.hist_uso_pct.append(self.mem_contigua.hist_uso[-1])
-            self.hist_frag.append(self.mem_contigua.hist_frag[-1])
         else:
             self.mem_paginada.tick_metricas()
-            self.hist_uso_pct.append(self.mem_paginada.hist_uso[-1])
             self.hist_fallos.append(self.mem_paginada.fallos_pagina)
 
         self.planificador.tick()
         self.ahora += 1
 
+    @property
+    def hist_uso_pct(self) -> array:
+        if self.modo == "CONTIGUA":
+            return self.mem_contigua.hist_uso
+        return self.mem_paginada.hist_uso
+
+    @property
+    def hist_frag(self) -> array:
+        if self.modo == "CONTIGUA":
+            return self.mem_contigua.hist_frag
+        return array("d")
+
     def uso_actual(self) -> float:
         if self.modo == "CONTIGUA":
             return self.mem_contigua.proporcion_uso()
@@ -429,6 +585,19 @@ class Simulador:
     def terminado(self) -> bool:
         return len(self.finalizados) == len(self.procesos)
 
+    def ejecutar_rapido(self, limite: Optional[int] = None):
+        # Corrida sin interfaz (barridos de parámetros / stress): avanza hasta que
+        # terminen todos los procesos o hasta el tick `limite`, y devuelve los resultados
+        paso = self.paso
+        terminado = self.terminado
+        if limite is None:
+            while not terminado():
+                paso()
+        else:
+            while not terminado() and self.ahora < limite:
+                paso()
+        return self.resultados()
+
     def resultados(self):
         n = len(self.finalizados)
         if n == 0:
@@ -438,18 +607,36 @@ class Simulador:
         res = {"completados": n, "total": len(self.procesos),
                "espera_prom": espera_prom, "retorno_prom": retorno_prom}
         if self.modo == "CONTIGUA":
-            uso_prom = sum(self.mem_contigua.hist_uso) / len(self.mem_contigua.hist_uso)
-            frag_prom = sum(self.mem_contigua.hist_frag) / len(self.mem_contigua.hist_frag)
-            libre_final = sum(h.tamanio for h in self.mem_contigua.huecos)
-            mayor_hueco = max((h.tamanio for h in self.mem_contigua.huecos), default=0)
+            uso_prom = fmean(self.mem_contigua.hist_uso)
+            frag_prom = fmean(self.mem_contigua.hist_frag)
+            libre_final = self.mem_contigua.memoria_libre()
+            mayor_hueco = self.mem_contigua.mayor_hueco()
             res.update({"uso_prom": uso_prom, "frag_prom": frag_prom,
                         "libre_final": libre_final, "mayor_hueco": mayor_hueco})
         else:
-            uso_prom = sum(self.mem_paginada.hist_uso) / len(self.mem_paginada.hist_uso)
+            uso_prom = fmean(self.mem_paginada.hist_uso)
             res.update({"uso_prom": uso_prom, "fallos_pagina": self.mem_paginada.fallos_pagina})
         return res
 
 
+# ===========================
+# Paleta de colores por PID
+# ===========================
+
+def _generar_paleta(n: int) -> List[str]:
+    # Tonos repartidos con la razón áurea: PIDs consecutivos quedan bien diferenciados
+    paleta = []
+    for i in range(n):
+        r, g, b = colorsys.hls_to_rgb((i * 0.618033988749895) % 1.0, 0.52, 0.55)
+        paleta.append(f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}")
+    return paleta
+
+
+PALETA_PID = _generar_paleta(256)
+# Color de la línea de uso (el mismo en la vista en vivo y en el PNG exportado)
+COLOR_LINEA_USO = "#1f77b4"
+
+
 # ===========================
 # Tooltip helper (para botones y casillas)
 # ===========================
@@ -461,6 +648,7 @@ class Tooltip:
         self.delay = delay
         self._id = None
         self._tip = None
+        self._lbl = None
         self.widget.bind("<Enter>", self._schedule)
         self.widget.bind("<Leave>", self._hide)
         self.widget.bind("<ButtonPress>", self._hide)
@@ -475,32 +663,36 @@ class Tooltip:
             self._id = None
 
     def _show(self):
-        if self._tip or not self.text:
+        if not self.text:
             return
         x, y, cx, cy = self.widget.bbox("insert") if self.widget.winfo_viewable() else (0, 0, 0, 0)
         x += self.widget.winfo_rootx() + 20
         y += self.widget.winfo_rooty() + 20
-        self._tip = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        frm = tk.Frame(tw, bg="#1f242e", bd=0)
-        frm.pack()
-        lbl = tk.Label(frm, text=self.text, justify="left",
-                       bg="#1f242e", fg="#e6edf3",
-                       relief="flat", bd=0, padx=8, pady=5,
-                       font=("Consolas", 9))
-        lbl.pack()
-        # borde sutil
-        tk.Frame(tw, bg="#30363d", height=1).place(x=0, y=0, relwidth=1)
-        tk.Frame(tw, bg="#30363d", height=1).place(x=0, rely=1.0, relwidth=1, anchor="sw")
-        tk.Frame(tw, bg="#30363d", width=1).place(y=0, x=0, relheight=1)
-        tk.Frame(tw, bg="#30363d", width=1).place(rely=1.0, relheight=1, relx=1.0, anchor="se")
+        if self._tip is None:
+            # Se construye una sola vez; después solo se muestra/oculta
+            self._tip = tw = tk.Toplevel(self.widget)
+            tw.wm_overrideredirect(True)
+            frm = tk.Frame(tw, bg="#1f242e", bd=0)
+            frm.pack()
+            self._lbl = tk.Label(frm, text=self.text, justify="left",
+                                 bg="#1f242e", fg="#e6edf3",
+                                 relief="flat", bd=0, padx=8, pady=5,
+                                 font=("Consolas", 9))
+            self._lbl.pack()
+            # borde sutil
+            tk.Frame(tw, bg="#30363d", height=1).place(x=0, y=0, relwidth=1)
+            tk.Frame(tw, bg="#30363d", height=1).place(x=0, rely=1.0, relwidth=1, anchor="sw")
+            tk.Frame(tw, bg="#30363d", width=1).place(y=0, x=0, relheight=1)
+            tk.Frame(tw, bg="#30363d", width=1).place(rely=1.0, relheight=1, relx=1.0, anchor="se")
+        else:
+            self._lbl.config(text=self.text)
+        self._tip.wm_geometry(f"+{x}+{y}")
+        self._tip.deiconify()
 
     def _hide(self, _e=None):
         self._unschedule()
         if self._tip:
-            self._tip.destroy()
-            self._tip = None
+            self._tip.withdraw()
 
 
 # ===========================
@@ -508,6 +700,13 @@ class Tooltip:
 # ===========================
 
 class Aplicacion(tk.Tk):
+    # Puntos máximos que se entregan a la línea del gráfico (~ancho en píxeles)
+    MAX_PUNTOS_GRAFICO = 500
+    # Repintado a ~30 FPS como máximo, independiente de la velocidad de simulación
+    MIN_INTERVALO_PINTADO = 1 / 30
+    # Tiempo máximo de simulación por vuelta del mainloop (segundos)
+    PRESUPUESTO_PASOS = 0.008
+
     def __init__(self):
         super().__init__()
         self.title("TP2 – Sistemas Operativos (Modo Oscuro)")
@@ -517,37 +716,63 @@ class Aplicacion(tk.Tk):
         self.ejecutando = False
         self.pausado = False
         self.ms_por_tick = 120
-
-        # Cache de colores por PID
-        self._color_cache = {}
+        self._paso = self._terminado = None   # sim.paso / sim.terminado ligados en iniciar()
+        # ((bloques, huecos), (memoria, versión)) de la última vista contigua dibujada
+        self._mem_view_cache = (None, None)
+        # (memoria, versión, vista detallada, ancho, alto) del último dibujo de la barra
+        self._clave_dibujo = None
 
         # Vista: detallada (bloques) o compacta (porcentaje)
         self.var_vista_detallada = tk.BooleanVar(value=True)
 
+        self._configurar_estilos()
         self._construir_controles()
         self._construir_vistas()
 
-    # ---- Controles ----
-    def _construir_controles(self):
+    def _configurar_estilos(self):
+        # Colores por defecto de cada clase de widget (base de opciones de Tk): se cargan
+        # una vez y los constructores solo indican lo que se aparta del tema
         fg = "#e6edf3"
         bg_panel = "#161b22"
+        for clase in ("Frame", "Label", "Checkbutton"):
+            self.option_add(f"*{clase}.background", bg_panel)
+        for clase in ("Label", "Checkbutton", "Entry"):
+            self.option_add(f"*{clase}.foreground", fg)
+        self.option_add("*Entry.background", "#0d1117")
+        self.option_add("*Entry.insertBackground", fg)
+        self.option_add("*Checkbutton.selectColor", bg_panel)
+        self.option_add("*Checkbutton.activeBackground", bg_panel)
+        self.option_add("*Checkbutton.activeForeground", fg)
+        self.option_add("*Button.background", "#21262d")
+        self.option_add("*Button.foreground", fg)
+        ttk.Style().configure("TCombobox", fieldbackground="#0f1115", background="#0f1115", foreground="white")
+
+    # ---- Controles ----
+    def _crear_campo(self, padre, etiqueta: str, valor: str, ancho: int, columna: int, ayuda: str) -> tk.Entry:
+        # Etiqueta + Entry (con valor inicial y tooltip) en la fila 0 del contenedor
+        tk.Label(padre, text=etiqueta).grid(row=0, column=columna, sticky="w")
+        ent = tk.Entry(padre, width=ancho)
+        ent.insert(0, valor)
+        ent.grid(row=0, column=columna + 1, padx=5)
+        Tooltip(ent, ayuda)
+        return ent
 
-        marco = tk.Frame(self, bg=bg_panel, bd=1, relief="solid")
+    def _construir_controles(self):
+        marco = tk.Frame(self, bd=1, relief="solid")
         marco.pack(fill="x", padx=10, pady=10)
 
-        fila1 = tk.Frame(marco, bg=bg_panel)
+        fila1 = tk.Frame(marco)
         fila1.pack(fill="x", padx=8, pady=6)
 
-        lbl_modo = tk.Label(fila1, text="Modo", fg=fg, bg=bg_panel)
+        lbl_modo = tk.Label(fila1, text="Modo")
         lbl_modo.grid(row=0, column=0, sticky="w")
         self.var_modo = tk.StringVar(value="CONTIGUA")
-        ttk.Style().configure("TCombobox", fieldbackground="#0f1115", background="#0f1115", foreground="white")
         self.cmb_modo = ttk.Combobox(fila1, textvariable=self.var_modo, values=["CONTIGUA", "PAGINACION"],
                                      width=12, state="readonly")
         self.cmb_modo.grid(row=0, column=1, padx=5)
         Tooltip(self.cmb_modo, "Selecciona el esquema de memoria: CONTIGUA o PAGINACIÓN")
 
-        lbl_asig = tk.Label(fila1, text="Asignador (CONTIGUA)", fg=fg, bg=bg_panel)
+        lbl_asig = tk.Label(fila1, text="Asignador (CONTIGUA)")
         lbl_asig.grid(row=0, column=2, sticky="w")
 
         self.opciones_asign = {
@@ -567,71 +792,45 @@ class Aplicacion(tk.Tk):
         self.cmb_asign.grid(row=0, column=3, padx=5)
         Tooltip(self.cmb_asign, "Estrategia de ubicación para memoria CONTIGUA")
 
-        tk.Label(fila1, text="Memoria total", fg=fg, bg=bg_panel).grid(row=0, column=4, sticky="w")
-        self.ent_mem = tk.Entry(fila1, width=10, bg="#0d1117", fg=fg, insertbackground=fg)
-        self.ent_mem.insert(0, "1024")
-        self.ent_mem.grid(row=0, column=5, padx=5)
-        Tooltip(self.ent_mem, "Tamaño total de memoria (unidades)")
-
-        tk.Label(fila1, text="Tamaño de página (PAGINACIÓN)", fg=fg, bg=bg_panel).grid(row=0, column=6, sticky="w")
-        self.ent_pag = tk.Entry(fila1, width=10, bg="#0d1117", fg=fg, insertbackground=fg)
-        self.ent_pag.insert(0, "64")
-        self.ent_pag.grid(row=0, column=7, padx=5)
-        Tooltip(self.ent_pag, "Tamaño de página/frames (solo en PAGINACIÓN)")
-
-        tk.Label(fila1, text="Quantum", fg=fg, bg=bg_panel).grid(row=0, column=8, sticky="w")
-        self.ent_q = tk.Entry(fila1, width=6, bg="#0d1117", fg=fg, insertbackground=fg)
-        self.ent_q.insert(0, "3")
-        self.ent_q.grid(row=0, column=9, padx=5)
-        Tooltip(self.ent_q, "Quantum del Round Robin (ticks por turno)")
-
-        fila2 = tk.Frame(marco, bg=bg_panel)
+        self.ent_mem = self._crear_campo(fila1, "Memoria total", "1024", 10, 4,
+                                         "Tamaño total de memoria (unidades)")
+
+        self.ent_pag = self._crear_campo(fila1, "Tamaño de página (PAGINACIÓN)", "64", 10, 6,
+                                         "Tamaño de página/frames (solo en PAGINACIÓN)")
+
+        self.ent_q = self._crear_campo(fila1, "Quantum", "3", 6, 8, "Quantum del Round Robin (ticks por turno)")
+
+        fila2 = tk.Frame(marco)
         fila2.pack(fill="x", padx=8, pady=6)
 
-        tk.Label(fila2, text="Ticks", fg=fg, bg=bg_panel).grid(row=0, column=0, sticky="w")
-        self.ent_ticks = tk.Entry(fila2, width=10, bg="#0d1117", fg=fg, insertbackground=fg)
-        self.ent_ticks.insert(0, "150")
-        self.ent_ticks.grid(row=0, column=1, padx=5)
-        Tooltip(self.ent_ticks, "Duración total de la simulación en ticks")
+        self.ent_ticks = self._crear_campo(fila2, "Ticks", "150", 10, 0,
+                                           "Duración total de la simulación en ticks")
 
-        tk.Label(fila2, text="Procesos (stress)", fg=fg, bg=bg_panel).grid(row=0, column=2, sticky="w")
-        self.ent_stress = tk.Entry(fila2, width=10, bg="#0d1117", fg=fg, insertbackground=fg)
-        self.ent_stress.insert(0, "18")
-        self.ent_stress.grid(row=0, column=3, padx=5)
-        Tooltip(self.ent_stress, "Cantidad de procesos a generar")
+        self.ent_stress = self._crear_campo(fila2, "Procesos (stress)", "18", 10, 2,
+                                            "Cantidad de procesos a generar")
 
-        tk.Label(fila2, text="Semilla", fg=fg, bg=bg_panel).grid(row=0, column=4, sticky="w")
-        self.ent_semilla = tk.Entry(fila2, width=10, bg="#0d1117", fg=fg, insertbackground=fg)
-        self.ent_semilla.insert(0, "42")
-        self.ent_semilla.grid(row=0, column=5, padx=5)
-        Tooltip(self.ent_semilla, "Semilla para reproducibilidad de los procesos")
+        self.ent_semilla = self._crear_campo(fila2, "Semilla", "42", 10, 4,
+                                             "Semilla para reproducibilidad de los procesos")
 
         self.var_fifo = tk.BooleanVar(value=False)
-        self.chk_fifo = tk.Checkbutton(fila2, text="Reemplazo FIFO (PAGINACIÓN)", variable=self.var_fifo,
-                                       fg=fg, bg=bg_panel, selectcolor=bg_panel,
-                                       activebackground=bg_panel, activeforeground=fg)
+        self.chk_fifo = tk.Checkbutton(fila2, text="Reemplazo FIFO (PAGINACIÓN)", variable=self.var_fifo)
         self.chk_fifo.grid(row=0, column=6, padx=10)
         Tooltip(self.chk_fifo, "Si se llena, reemplaza frames con política FIFO")
 
-        tk.Label(fila2, text="Velocidad (ms/tick)", fg=fg, bg=bg_panel).grid(row=0, column=7, sticky="w")
-        self.ent_vel = tk.Entry(fila2, width=10, bg="#0d1117", fg=fg, insertbackground=fg)
-        self.ent_vel.insert(0, "120")
-        self.ent_vel.grid(row=0, column=8, padx=5)
-        Tooltip(self.ent_vel, "Tiempo real entre ticks (en milisegundos)")
+        self.ent_vel = self._crear_campo(fila2, "Velocidad (ms/tick)", "120", 10, 7,
+                                         "Tiempo real entre ticks (en milisegundos)")
 
         # --- Switch de vista detallada/compacta ---
         self.chk_vista = tk.Checkbutton(
             fila2,
             text="Vista detallada de memoria",
             variable=self.var_vista_detallada,
-            fg=fg, bg=bg_panel, selectcolor=bg_panel,
-            activebackground=bg_panel, activeforeground=fg,
             command=self._dibujar_memoria
         )
         self.chk_vista.grid(row=0, column=9, padx=10, sticky="w")
         Tooltip(self.chk_vista, "Alterna entre bloques por proceso y barra de porcentaje")
 
-        fila3 = tk.Frame(marco, bg=bg_panel)
+        fila3 = tk.Frame(marco)
         fila3.pack(fill="x", padx=8, pady=6)
         self.btn_iniciar = tk.Button(fila3, text="Iniciar", command=self.iniciar, bg="#238636", fg="white")
         self.btn_iniciar.pack(side="left", padx=4)
@@ -645,114 +844,123 @@ class Aplicacion(tk.Tk):
         self.btn_reiniciar.pack(side="left", padx=4)
         Tooltip(self.btn_reiniciar, "Detiene y limpia todo para empezar de cero")
 
-        self.btn_compactar = tk.Button(fila3, text="Compactar ahora", command=self.compactar_ahora,
-                                       bg="#21262d", fg="#e6edf3")
+        self.btn_compactar = tk.Button(fila3, text="Compactar ahora", command=self.compactar_ahora)
         self.btn_compactar.pack(side="left", padx=4)
         Tooltip(self.btn_compactar, "Memoria CONTIGUA: desplaza bloques para eliminar fragmentación")
 
-        fila4 = tk.Frame(marco, bg=bg_panel)
+        fila4 = tk.Frame(marco)
         fila4.pack(fill="x", padx=8, pady=6)
-        tk.Label(fila4, text="Escenarios:", fg=fg, bg=bg_panel, font=("Segoe UI", 10, "bold")).pack(
+        tk.Label(fila4, text="Escenarios:", font=("Segoe UI", 10, "bold")).pack(
             side="left", padx=(0, 10)
         )
-        b1 = tk.Button(fila4, text="CONTIGUA + Primer/Ajuste", bg="#21262d", fg=fg,
+        b1 = tk.Button(fila4, text="CONTIGUA + Primer/Ajuste",
                        command=self.preset_contigua_primer)
         b1.pack(side="left", padx=3)
         Tooltip(b1, "Configura CONTIGUA + Primer ajuste y ejecuta")
 
-        b2 = tk.Button(fila4, text="CONTIGUA + Mejor/Ajuste", bg="#21262d", fg=fg,
+        b2 = tk.Button(fila4, text="CONTIGUA + Mejor/Ajuste",
                        command=self.preset_contigua_mejor)
         b2.pack(side="left", padx=3)
         Tooltip(b2, "Configura CONTIGUA + Mejor ajuste y ejecuta")
 
-        b3 = tk.Button(fila4, text="PAGINACIÓN (sin reemplazo)", bg="#21262d", fg=fg,
+        b3 = tk.Button(fila4, text="PAGINACIÓN (sin reemplazo)",
                        command=self.preset_paginacion)
         b3.pack(side="left", padx=3)
         Tooltip(b3, "Configura PAGINACIÓN sin reemplazo y ejecuta")
 
-        b4 = tk.Button(fila4, text="PAGINACIÓN + FIFO", bg="#21262d", fg=fg,
+        b4 = tk.Button(fila4, text="PAGINACIÓN + FIFO",
                        command=self.preset_paginacion_fifo)
         b4.pack(side="left", padx=3)
         Tooltip(b4, "Configura PAGINACIÓN con reemplazo FIFO y ejecuta")
 
-        fila5 = tk.Frame(marco, bg=bg_panel)
+        fila5 = tk.Frame(marco)
         fila5.pack(fill="x", padx=8, pady=6)
-        tk.Label(fila5, text="Exportar:", fg=fg, bg=bg_panel, font=("Segoe UI", 10, "bold")).pack(
+        tk.Label(fila5, text="Exportar:", font=("Segoe UI", 10, "bold")).pack(
             side="left", padx=(0, 10)
         )
-        bcsv = tk.Button(fila5, text="Exportar CSV", bg="#21262d", fg=fg, command=self.exportar_csv)
+        bcsv = tk.Button(fila5, text="Exportar CSV", command=self.exportar_csv)
         bcsv.pack(side="left", padx=3)
         Tooltip(bcsv, "Guarda métricas por tick en reporte.CSV")
 
-        bpng = tk.Button(fila5, text="Guardar gráfico (PNG)", bg="#21262d", fg=fg, command=self.guardar_png)
+        bpng = tk.Button(fila5, text="Guardar gráfico (PNG)", command=self.guardar_png)
         bpng.pack(side="left", padx=3)
         Tooltip(bpng, "Exporta el gráfico de uso en una imagen PNG")
 
     # ---- Vistas ----
     def _construir_vistas(self):
-        fg = "#e6edf3"
         subfg = "#9da7b3"
-        bg_panel = "#161b22"
 
-        encabezado = tk.Frame(self, bg=bg_panel, bd=1, relief="solid")
+        encabezado = tk.Frame(self, bd=1, relief="solid")
         encabezado.pack(fill="x", padx=10, pady=(0, 10))
-        self.lbl_titulo = tk.Label(encabezado, text="Modo: -  |  t=0", fg=fg, bg=bg_panel, font=("Segoe UI", 12, "bold"))
+        self.lbl_titulo = tk.Label(encabezado, text="Modo: -  |  t=0", font=("Segoe UI", 12, "bold"))
         self.lbl_titulo.pack(side="left", padx=8, pady=6)
 
         principal = tk.Frame(self, bg=self["bg"])
         principal.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
-        izq = tk.Frame(principal, bg=bg_panel, bd=1, relief="solid")
+        izq = tk.Frame(principal, bd=1, relief="solid")
         izq.pack(side="left", fill="both", expand=True, padx=(0, 5))
-        tk.Label(izq, text="EJECUTANDO", fg="#31d07d", bg=bg_panel, font=("Consolas", 12, "bold")).pack(
+        tk.Label(izq, text="EJECUTANDO", fg="#31d07d", font=("Consolas", 12, "bold")).pack(
             anchor="w", padx=8, pady=(8, 0)
         )
-        self.lbl_run = tk.Label(izq, text="-", fg=fg, bg=bg_panel, font=("Consolas", 11))
+        self.lbl_run = tk.Label(izq, text="-", font=("Consolas", 11))
         self.lbl_run.pack(anchor="w", padx=12, pady=4)
-        tk.Label(izq, text="LISTOS", fg=fg, bg=bg_panel, font=("Consolas", 12, "bold")).pack(
+        tk.Label(izq, text="LISTOS", font=("Consolas", 12, "bold")).pack(
             anchor="w", padx=8, pady=(8, 0)
         )
-        self.lbl_ready = tk.Label(izq, text="[]", fg=subfg, bg=bg_panel, font=("Consolas", 10))
+        self.lbl_ready = tk.Label(izq, text="[]", fg=subfg, font=("Consolas", 10))
         self.lbl_ready.pack(anchor="w", padx=12, pady=2)
-        tk.Label(izq, text="BLOQUEADOS", fg="#d29922", bg=bg_panel, font=("Consolas", 12, "bold")).pack(
+        tk.Label(izq, text="BLOQUEADOS", fg="#d29922", font=("Consolas", 12, "bold")).pack(
             anchor="w", padx=8, pady=(8, 0)
         )
-        self.lbl_block = tk.Label(izq, text="[]", fg=subfg, bg=bg_panel, font=("Consolas", 10))
+        self.lbl_block = tk.Label(izq, text="[]", fg=subfg, font=("Consolas", 10))
         self.lbl_block.pack(anchor="w", padx=12, pady=2)
 
-        der = tk.Frame(principal, bg=bg_panel, bd=1, relief="solid")
+        der = tk.Frame(principal, bd=1, relief="solid")
         der.pack(side="left", fill="both", expand=True, padx=(5, 0))
-        tk.Label(der, text="Memoria", fg=fg, bg=bg_panel, font=("Segoe UI", 12, "bold")).pack(
+        tk.Label(der, text="Memoria", font=("Segoe UI", 12, "bold")).pack(
             anchor="w", padx=8, pady=(8, 0)
         )
         self.lienzo = tk.Canvas(der, height=40, bg="#0d1117", highlightthickness=0)
         self.lienzo.pack(fill="x", padx=8, pady=(6, 2))
-        self.lbl_uso = tk.Label(der, text="Uso: 0%", fg=fg, bg=bg_panel, font=("Consolas", 10))
+        # Ítems persistentes del lienzo: se reconfiguran en cada tick en vez de borrarse y recrearse
+        self._fondo_id = self.lienzo.create_rectangle(0, 0, 0, 0, fill="#0d1117", outline="#22272e",
+                                                      width=1, state="hidden")
+        self._barra_id = self.lienzo.create_rectangle(0, 0, 0, 0, fill="#238636", outline="", width=0,
+                                                      state="hidden")
+        self._fondo_coords = None
+        self._rect_ids: List[int] = []
+        self._rect_estado: list = []      # (coords, config) aplicados a cada rectángulo
+        self._rects_visibles = 0
+        self._item_info: dict[int, str] = {}  # id de rectángulo -> texto del tooltip
+        self._texto_ids: List[int] = []
+        self._texto_estado: list = []
+        self._textos_visibles = 0
+        self.lbl_uso = tk.Label(der, text="Uso: 0%", font=("Consolas", 10))
         self.lbl_uso.pack(anchor="w", padx=8, pady=(0, 4))
-        self.lbl_extra = tk.Label(der, text="", fg=subfg, bg=bg_panel, font=("Consolas", 10))
+        self.lbl_extra = tk.Label(der, text="", fg=subfg, font=("Consolas", 10))
         self.lbl_extra.pack(anchor="w", padx=8, pady=(0, 8))
 
         # Mini leyenda
-        self.leyenda = tk.Frame(der, bg=bg_panel)
+        self.leyenda = tk.Frame(der)
         self.leyenda.pack(fill="x", padx=8, pady=(0, 8))
-
-        self.fig = Figure(figsize=(5, 2.3), dpi=100, facecolor="#0f1115")
-        self.ax = self.fig.add_subplot(111, facecolor="#0f1115")
-        self.ax.tick_params(colors="#9da7b3")
-        for sp in self.ax.spines.values():
-            sp.set_color("#30363d")
-        self.ax.set_title("Uso de memoria/frames (%)", color="#e6edf3", fontsize=10)
-        self.ax.set_xlabel("tick", color="#9da7b3")
-        self.ax.set_ylabel("%", color="#9da7b3")
-        self.xdatos, self.ydatos = [], []
-        (self.linea,) = self.ax.plot([], [], linewidth=2)
-        self.canvas_plot = FigureCanvasTkAgg(self.fig, master=der)
-        self.canvas_plot.get_tk_widget().pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        # Chips persistentes (máx 6): se reconfiguran solo cuando cambia el conjunto de PIDs
+        self._chips = [self._chip_leyenda() for _ in range(6)]
+        self._chips_pids: Tuple[int, ...] = ()
+
+        # Gráfico de uso sobre un Canvas de Tk: ejes/grilla estáticos (tag "ejes") y una
+        # única polilínea que se actualiza con coords(); Matplotlib queda solo para el PNG
+        self.grafico = tk.Canvas(der, width=500, height=230, bg="#0f1115", highlightthickness=0)
+        self.grafico.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        self._linea_id = self.grafico.create_line(-10, -10, -10, -10, fill=COLOR_LINEA_USO, width=2)
+        self.xdatos, self.ydatos = array("d"), array("d")
+        self._xmax_grafico = 30
+        self._area_grafico = (0, 0, 1, 1)   # (x0, y0, x1, y1) del área de trazado en px
+        self.grafico.bind("<Configure>", lambda e: self._redibujar_grafico())
 
         # Marcadores de compactación
         self.compact_ticks = []      # ticks donde hubo compactación
-        self._compact_lines = []     # artistas de axvline
-        self._legend_added = False   # evitar múltiples leyendas
+        self._n_marcas = 0           # marcadores dibujados en la capa estática
 
         # Tooltip de bloques/huecos (barra de memoria)
         self.tooltip = tk.Label(self, text="", bg="#1f242e", fg="#e6edf3",
@@ -764,6 +972,14 @@ class Aplicacion(tk.Tk):
     def _hover_bind(self):
         self.lienzo.bind("<Motion>", self._on_canvas_motion)
         self.lienzo.bind("<Leave>", lambda e: self.tooltip.place_forget())
+        # Origen de la ventana en pantalla: se cachea y solo se relee al mover/redimensionar
+        self._raiz_x, self._raiz_y = self.winfo_rootx(), self.winfo_rooty()
+        self.bind("<Configure>", self._on_configure_raiz)
+
+    def _on_configure_raiz(self, event):
+        # <Configure> del toplevel se propaga a todos los hijos: solo interesa el propio
+        if event.widget is self:
+            self._raiz_x, self._raiz_y = self.winfo_rootx(), self.winfo_rooty()
 
     def _on_canvas_motion(self, event):
         # Si la vista es compacta: no hay tooltip de bloques
@@ -771,44 +987,91 @@ class Aplicacion(tk.Tk):
             self.tooltip.place_forget()
             return
         item = self.lienzo.find_closest(event.x, event.y)
-        tags = self.lienzo.gettags(item)
-        info = None
-        for t in tags:
-            if t.startswith("bloque:"):
-                _, pid, label = t.split(":", 2)
-                info = label.replace("|", "\n")
-                break
-            if t.startswith("hueco:"):
-                _, label = t.split(":", 1)
-                info = label.replace("|", "\n")
-                break
+        info = self._item_info.get(item[0]) if item else None
         if info:
             self.tooltip.config(text=info)
-            x = self.winfo_pointerx() - self.winfo_rootx() + 12
-            y = self.winfo_pointery() - self.winfo_rooty() + 12
+            x = event.x_root - self._raiz_x + 12
+            y = event.y_root - self._raiz_y + 12
             self.tooltip.place(x=x, y=y)
         else:
             self.tooltip.place_forget()
 
+    def _pintar_rect(self, i: int, coords: Tuple[float, float, float, float], cfg: dict, info: str):
+        # Reutiliza el rectángulo i del pool; solo envía a Tk lo que cambió.
+        # El texto del tooltip queda en _item_info (id -> texto), no en los tags
+        if i == len(self._rect_ids):
+            self._rect_ids.append(self.lienzo.create_rectangle(0, 0, 0, 0, width=1, state="hidden"))
+            self._rect_estado.append(None)
+            self.lienzo.tag_raise("etiqueta")  # los textos quedan siempre por encima
+        item = self._rect_ids[i]
+        previo = self._rect_estado[i]
+        if previo is None or previo[0] != coords:
+            self.lienzo.coords(item, *coords)
+        if previo is None or previo[1] != cfg:
+            self.lienzo.itemconfigure(item, state="normal", **cfg)
+        self._rect_estado[i] = (coords, cfg)
+        self._item_info[item] = info
+
+    def _pintar_texto(self, i: int, x: float, y: float, texto: str):
+        if i == len(self._texto_ids):
+            self._texto_ids.append(self.lienzo.create_text(0, 0, fill="#0b0e13", font=("Consolas", 9, "bold"),
+                                                           tags=("etiqueta",), state="hidden"))
+            self._texto_estado.append(None)
+        item = self._texto_ids[i]
+        previo = self._texto_estado[i]
+        if previo is None or previo[0] != (x, y):
+            self.lienzo.coords(item, x, y)
+        if previo is None or previo[1] != texto:
+            self.lienzo.itemconfigure(item, text=texto, state="normal")
+        self._texto_estado[i] = ((x, y), texto)
+
+    def _ocultar_desde(self, n_rects: int, n_textos: int):
+        # Oculta los ítems del pool que sobran respecto del dibujo actual
+        for i in range(n_rects, self._rects_visibles):
+            self.lienzo.itemconfigure(self._rect_ids[i], state="hidden")
+            self._rect_estado[i] = None
+            self._item_info.pop(self._rect_ids[i], None)
+        for i in range(n_textos, self._textos_visibles):
+            self.lienzo.itemconfigure(self._texto_ids[i], state="hidden")
+            self._texto_estado[i] = None
+        self._rects_visibles = n_rects
+        self._textos_visibles = n_textos
+
+    def _limpiar_lienzo(self):
+        self._clave_dibujo = None
+        self.lienzo.itemconfigure(self._fondo_id, state="hidden")
+        self.lienzo.itemconfigure(self._barra_id, state="hidden")
+        self._fondo_coords = None
+        self._ocultar_desde(0, 0)
+
     def _color_pid(self, pid: int) -> str:
-        if pid in self._color_cache:
-            return self._color_cache[pid]
-        h = (int(hashlib.md5(str(pid).encode()).hexdigest(), 16) % 360) / 360.0
-        s = 0.55
-        l = 0.52
-        r, g, b = colorsys.hls_to_rgb(h, l, s)
-        hexcol = f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-        self._color_cache[pid] = hexcol
-        return hexcol
-
-    def _chip_leyenda(self, pid: int):
-        marco = tk.Frame(self.leyenda, bg="#161b22")
-        col = self._color_pid(pid)
+        return PALETA_PID[pid & 255]
+
+    def _chip_leyenda(self):
+        marco = tk.Frame(self.leyenda)
         dot = tk.Canvas(marco, width=14, height=14, bg="#161b22", highlightthickness=0)
-        dot.create_oval(2, 2, 12, 12, fill=col, outline=col)
+        oval = dot.create_oval(2, 2, 12, 12)
         dot.pack(side="left", padx=(0, 6))
-        tk.Label(marco, text=f"PID {pid}", bg="#161b22", fg="#b9c3cf", font=("Consolas", 9)).pack(side="left")
-        return marco
+        lbl = tk.Label(marco, fg="#b9c3cf", font=("Consolas", 9))
+        lbl.pack(side="left")
+        return marco, dot, oval, lbl
+
+    def _mostrar_leyenda(self, pids: List[int]):
+        pids = tuple(pids[:6])
+        previos = self._chips_pids
+        if pids == previos:
+            return
+        for i, (marco, dot, oval, lbl) in enumerate(self._chips):
+            if i < len(pids):
+                if i >= len(previos) or previos[i] != pids[i]:
+                    col = self._color_pid(pids[i])
+                    dot.itemconfigure(oval, fill=col, outline=col)
+                    lbl.config(text=f"PID {pids[i]}")
+                if i >= len(previos):
+                    marco.pack(side="left", padx=4)
+            elif i < len(previos):
+                marco.pack_forget()
+        self._chips_pids = pids
 
     # ---- Lógica ----
     def _leer_parametros(self):
@@ -838,40 +1101,77 @@ class Aplicacion(tk.Tk):
             return
         self.ms_por_tick = p.pop("velocidad")
         self.sim = Simulador(**p)
+        # Métodos ligados una sola vez: el bucle no repite la búsqueda de atributos por tick
+        self._paso = self.sim.paso
+        self._terminado = self.sim.terminado
         self._reiniciar_grafico()
         self.ejecutando = True
         self.pausado = False
+        self._t_proximo_paso = time.perf_counter()
+        self._ultimo_pintado = 0.0
+        self._tick_pintado = -1   # último sim.ahora que llegó a la pantalla
         self._bucle()
 
+    def _pintar(self):
+        self._dibujar_memoria()
+        self._actualizar_listas()
+        self._actualizar_grafico()
+        self._tick_pintado = self.sim.ahora
+
+    def _pintar_pendiente(self):
+        # Fuera del camino en ejecución (pausa) no hay límite de FPS: se muestran
+        # los ticks que el throttling dejó sin pintar
+        if self.sim and self.sim.ahora != self._tick_pintado:
+            self._pintar()
+
     def _bucle(self):
         if not self.ejecutando:
             return
-        if not self.pausado and self.sim and not self.sim.terminado():
-            self.sim.paso()
-            self._dibujar_memoria()
-            self._actualizar_listas()
-            self._actualizar_grafico()
-            self.after(self.ms_por_tick, self._bucle)
+        terminado = self._terminado
+        if not self.pausado and terminado and not terminado():
+            # Avanza todos los ticks vencidos según ms/tick (al menos uno), sin pasarse
+            # del presupuesto por vuelta; el dibujo se hace aparte y a tasa acotada
+            paso, reloj = self._paso, time.perf_counter
+            periodo = self.ms_por_tick / 1000.0
+            proximo = self._t_proximo_paso
+            limite = reloj() + self.PRESUPUESTO_PASOS
+            while True:
+                paso()
+                proximo += periodo
+                ahora = reloj()
+                if terminado() or ahora >= limite or proximo > ahora:
+                    break
+            if proximo < ahora - 0.25:
+                proximo = ahora  # no acumular atraso si la máquina no da abasto
+            self._t_proximo_paso = proximo
+            if ahora - self._ultimo_pintado >= self.MIN_INTERVALO_PINTADO:
+                self._pintar()
+                self._ultimo_pintado = ahora
+            self.after(max(1, int((proximo - ahora) * 1000)), self._bucle)
         else:
-            if self.sim and self.sim.terminado():
-                self._dibujar_memoria()
-                self._actualizar_listas()
-                self._actualizar_grafico()
+            if terminado and terminado():
+                self._pintar()
                 self._mostrar_resultados()
                 self.ejecutando = False
             else:
+                self._pintar_pendiente()
                 self.after(self.ms_por_tick, self._bucle)
 
     def pausar_reanudar(self):
         if not self.ejecutando:
             return
         self.pausado = not self.pausado
+        if self.pausado:
+            self._pintar_pendiente()
+        else:
+            self._t_proximo_paso = time.perf_counter()
         self.btn_pausa.config(text="Reanudar" if self.pausado else "Pausar")
 
     def reiniciar(self):
         self.ejecutando = False
         self.pausado = False
         self.sim = None
+        self._paso = self._terminado = None
         self._resetear_vistas()
 
     # Presets
@@ -918,38 +1218,77 @@ class Aplicacion(tk.Tk):
             return
         nombre = "reporte.CSV"
         ruta = os.path.join(os.getcwd(), nombre)
-        with open(ruta, "w", newline="", encoding="utf-8") as f:
+        # Columnas armadas de una vez y volcadas con un único writerows (buffer de 64 KiB)
+        usos = [round(u * 100, 3) for u in self.sim.hist_uso_pct]
+        if self.sim.modo == "CONTIGUA":
+            encabezado = ["tick", "uso_porcentaje", "fragmentacion"]
+            extra = [round(fr, 5) for fr in self.sim.hist_frag]
+        else:
+            encabezado = ["tick", "uso_porcentaje", "fallos_pagina"]
+            extra = self.sim.hist_fallos
+        import csv  # se carga recién al exportar
+        with open(ruta, "w", newline="", encoding="utf-8", buffering=1 << 16) as f:
             w = csv.writer(f)
-            if self.sim.modo == "CONTIGUA":
-                w.writerow(["tick", "uso_porcentaje", "fragmentacion"])
-                for t, (u, fr) in enumerate(zip(self.sim.hist_uso_pct, self.sim.hist_frag)):
-                    w.writerow([t, round(u * 100, 3), round(fr, 5)])
-            else:
-                w.writerow(["tick", "uso_porcentaje", "fallos_pagina"])
-                for t, (u, fp) in enumerate(zip(self.sim.hist_uso_pct, self.sim.hist_fallos)):
-                    w.writerow([t, round(u * 100, 3), fp])
+            w.writerow(encabezado)
+            w.writerows(zip(range(len(usos)), usos, extra))
         messagebox.showinfo("reporte.CSV", f"Archivo guardado en:\n{ruta}")
 
     def guardar_png(self):
         ts = time.strftime("%Y%m%d_%H%M%S")
         nombre = f"tp2_grafico_{ts}.png"
         ruta = os.path.join(os.getcwd(), nombre)
-        self.fig.savefig(ruta, dpi=150, bbox_inches="tight")
+        # Matplotlib se carga recién acá: la vista en vivo no lo necesita
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(5, 2.3), dpi=100, facecolor="#0f1115")
+        ax = fig.add_subplot(111, facecolor="#0f1115")
+        ax.tick_params(colors="#9da7b3")
+        for sp in ax.spines.values():
+            sp.set_color("#30363d")
+        ax.set_title("Uso de memoria/frames (%)", color="#e6edf3", fontsize=10)
+        ax.set_xlabel("tick", color="#9da7b3")
+        ax.set_ylabel("%", color="#9da7b3")
+        ax.plot(self.xdatos, self.ydatos, linewidth=2, color=COLOR_LINEA_USO)
+        ax.set_xlim(0, max(30, self.xdatos[-1] if self.xdatos else 30))
+        ax.set_ylim(0, 100)
+        if self.compact_ticks:
+            # x en datos, y en fracción del eje: cada marcador cubre toda la altura
+            ax.add_collection(LineCollection(
+                [[(t, 0), (t, 1)] for t in self.compact_ticks], colors="#f85149", linewidths=1.2,
+                linestyles="--", transform=ax.get_xaxis_transform(), label="Compactación"
+            ), autolim=False)
+            leg = ax.legend(loc="upper left", frameon=True)
+            leg.get_frame().set_facecolor("#0f1115")
+            leg.get_frame().set_edgecolor("#30363d")
+            for txt in leg.get_texts():
+                txt.set_color("#e6edf3")
+        fig.savefig(ruta, dpi=150, bbox_inches="tight")
         messagebox.showinfo("Guardar PNG", f"Imagen guardada en:\n{ruta}")
 
     # ---------- Dibujo de memoria ----------
     def _dibujar_memoria(self):
         if not self.sim:
             return
-        self.lienzo.delete("all")
         w = self.lienzo.winfo_width() or 600
         h = self.lienzo.winfo_height() or 40
+        self.lbl_titulo.config(text=f"Modo: {self.sim.modo}  |  t={self.sim.ahora}")
+        # Barra, métricas y leyenda dependen solo del estado de la memoria: si no cambió
+        # nada desde el último dibujo (ni la vista ni el tamaño), no hay nada que enviar a Tk
+        mem = self.sim.mem_contigua if self.sim.modo == "CONTIGUA" else self.sim.mem_paginada
+        clave = (mem, mem.version, self.var_vista_detallada.get(), w, h)
+        if clave == self._clave_dibujo:
+            return
+        self._clave_dibujo = clave
         padding = 4
         x0, y0 = padding, padding
         x1, y1 = w - padding, h - padding
 
-        # Fondo + borde sutil
-        self.lienzo.create_rectangle(x0, y0, x1, y1, fill="#0d1117", outline="#22272e", width=1)
+        # Fondo + borde sutil (solo se toca si cambió el tamaño del lienzo)
+        if self._fondo_coords != (x0, y0, x1, y1):
+            self.lienzo.coords(self._fondo_id, x0, y0, x1, y1)
+            self.lienzo.itemconfigure(self._fondo_id, state="normal")
+            self._fondo_coords = (x0, y0, x1, y1)
 
         # Métricas básicas
         uso = self.sim.uso_actual() * 100
@@ -961,49 +1300,64 @@ class Aplicacion(tk.Tk):
         else:
             self.lbl_extra.config(text=f"{etiqueta}: {valor}")
             total = self.sim.mem_paginada.total
-        self.lbl_titulo.config(text=f"Modo: {self.sim.modo}  |  t={self.sim.ahora}")
 
         # --- Vista compacta: barra % ---
         if not self.var_vista_detallada.get():
             usados_px = int((uso / 100.0) * (x1 - x0))
-            self.lienzo.create_rectangle(x0, y0, x0 + usados_px, y1, fill="#238636", outline="", width=0)
+            self.lienzo.coords(self._barra_id, x0, y0, x0 + usados_px, y1)
+            self.lienzo.itemconfigure(self._barra_id, state="normal")
+            self._ocultar_desde(0, 0)
             # Limpiar leyenda y tooltip
-            for wdg in list(self.leyenda.children.values()):
-                wdg.destroy()
+            self._mostrar_leyenda([])
             self.tooltip.place_forget()
             return
+        self.lienzo.itemconfigure(self._barra_id, state="hidden")
 
         # --- Vista detallada: bloques por proceso/huecos ---
+        n_rects = n_textos = 0
+        vistos = set()
+        pids_visibles = []  # en orden de aparición en la barra, para la leyenda
+        paleta = PALETA_PID  # lookup directo: evita una llamada a método por bloque/frame
         if self.sim.modo == "CONTIGUA":
-            blocks = []
-            free_blocks = []
-            asigns = sorted([(pid, ini, tam) for pid, (ini, tam) in self.sim.mem_contigua.asignaciones.items()],
-                            key=lambda x: x[1])
-            cursor = 0
-            for pid, ini, tam in asigns:
-                if ini > cursor:
-                    free_blocks.append((cursor, ini - cursor))
-                blocks.append((pid, ini, tam))
-                cursor = ini + tam
-            if cursor < total:
-                free_blocks.append((cursor, total - cursor))
-
+            # El orden de bloques y huecos solo se recalcula si el mapa cambió
+            mem = self.sim.mem_contigua
+            clave = (mem, mem.version)
+            if self._mem_view_cache[1] == clave:
+                blocks, free_blocks = self._mem_view_cache[0]
+            else:
+                blocks = []
+                free_blocks = []
+                asigns = sorted([(pid, ini, tam) for pid, (ini, tam) in mem.asignaciones.items()],
+                                key=lambda x: x[1])
+                cursor = 0
+                for pid, ini, tam in asigns:
+                    if ini > cursor:
+                        free_blocks.append((cursor, ini - cursor))
+                    blocks.append((pid, ini, tam))
+                    cursor = ini + tam
+                if cursor < total:
+                    free_blocks.append((cursor, total - cursor))
+                self._mem_view_cache = ((blocks, free_blocks), clave)
+
+            fy0 = y0 + 2
+            fy1 = y1 - 2
             # Procesos
             for pid, ini, tam in blocks:
                 if tam <= 0:
                     continue
-                col = self._color_pid(pid)
+                col = paleta[pid & 255]
                 fx = x0 + (ini / total) * (x1 - x0)
                 fw = max(1, (tam / total) * (x1 - x0))
-                fy0 = y0 + 2
-                fy1 = y1 - 2
-                self.lienzo.create_rectangle(
-                    fx, fy0, fx + fw, fy1, fill=col, outline="#0b0e13", width=1,
-                    tags=(f"bloque:{pid}:PID {pid}|Inicio {ini}|Tamaño {tam}",)
-                )
+                self._pintar_rect(n_rects, (fx, fy0, fx + fw, fy1),
+                                  dict(fill=col, outline="#0b0e13", dash=""),
+                                  f"PID {pid}\nInicio {ini}\nTamaño {tam}")
+                n_rects += 1
+                if pid not in vistos:
+                    vistos.add(pid)
+                    pids_visibles.append(pid)
                 if fw > 36:
-                    self.lienzo.create_text(fx + fw/2, (fy0 + fy1)/2, text=f"P{pid}", fill="#0b0e13",
-                                            font=("Consolas", 9, "bold"))
+                    self._pintar_texto(n_textos, fx + fw/2, (fy0 + fy1)/2, f"P{pid}")
+                    n_textos += 1
 
             # Huecos
             for ini, tam in free_blocks:
@@ -1011,54 +1365,36 @@ class Aplicacion(tk.Tk):
                     continue
                 fx = x0 + (ini / total) * (x1 - x0)
                 fw = max(1, (tam / total) * (x1 - x0))
-                fy0 = y0 + 2
-                fy1 = y1 - 2
-                self.lienzo.create_rectangle(
-                    fx, fy0, fx + fw, fy1, fill="#0f141b", outline="#29313a", dash=(2, 2),
-                    tags=(f"hueco:Libre|Inicio {ini}|Tamaño {tam}",)
-                )
+                self._pintar_rect(n_rects, (fx, fy0, fx + fw, fy1),
+                                  dict(fill="#0f141b", outline="#29313a", dash=(2, 2)),
+                                  f"Libre\nInicio {ini}\nTamaño {tam}")
+                n_rects += 1
         else:
             # PAGINACION: frames
             frames = self.sim.mem_paginada.cant_marcos
             ancho = (x1 - x0)
             alto0 = y0 + 2
             alto1 = y1 - 2
-            frame_pid = []
-            for par in self.sim.mem_paginada.marcos:
-                if par is None:
-                    frame_pid.append(None)
-                else:
-                    pid, _ = par
-                    frame_pid.append(pid)
-
-            for i, pid in enumerate(frame_pid):
+            fw = max(1, (1 / frames) * ancho)
+            # Una sola pasada sobre los marcos (par = (pid, página) o None si está libre)
+            for i, par in enumerate(self.sim.mem_paginada.marcos):
                 fx = x0 + (i / frames) * ancho
-                fw = max(1, (1 / frames) * ancho)
-                if pid is None:
-                    self.lienzo.create_rectangle(
-                        fx, alto0, fx + fw, alto1, fill="#0f141b", outline="#29313a",
-                        tags=(f"hueco:Frame {i}|Libre",)
-                    )
+                if par is None:
+                    cfg = dict(fill="#0f141b", outline="#29313a", dash="")
+                    info = f"Frame {i}\nLibre"
                 else:
-                    col = self._color_pid(pid)
-                    self.lienzo.create_rectangle(
-                        fx, alto0, fx + fw, alto1, fill=col, outline="#0b0e13",
-                        tags=(f"bloque:{pid}:PID {pid}|Frame {i}",)
-                    )
+                    pid = par[0]
+                    cfg = dict(fill=paleta[pid & 255], outline="#0b0e13", dash="")
+                    info = f"PID {pid}\nFrame {i}"
+                    if pid not in vistos:
+                        vistos.add(pid)
+                        pids_visibles.append(pid)
+                self._pintar_rect(n_rects, (fx, alto0, fx + fw, alto1), cfg, info)
+                n_rects += 1
+        self._ocultar_desde(n_rects, n_textos)
 
         # Leyenda (máx 6 PIDs visibles)
-        for wdg in list(self.leyenda.children.values()):
-            wdg.destroy()
-        pids_visibles = []
-        for item in self.lienzo.find_all():
-            for t in self.lienzo.gettags(item):
-                if t.startswith("bloque:"):
-                    pid = int(t.split(":")[1])
-                    if pid not in pids_visibles:
-                        pids_visibles.append(pid)
-        for pid in pids_visibles[:6]:
-            chip = self._chip_leyenda(pid)
-            chip.pack(side="left", padx=4)
+        self._mostrar_leyenda(pids_visibles)
 
     def _actualizar_listas(self):
         if not self.sim:
@@ -1069,56 +1405,98 @@ class Aplicacion(tk.Tk):
         self.lbl_block.config(text=str([p.pid for p in self.sim.planificador.bloqueados]))
 
     def _reiniciar_grafico(self):
-        self.xdatos, self.ydatos = [], []
-        self.linea.set_data([], [])
-        self.ax.set_xlim(0, 30)
-        self.ax.set_ylim(0, 100)
-
-        # limpiar líneas de compactación previas
-        for ln in getattr(self, "_compact_lines", []):
-            try:
-                ln.remove()
-            except Exception:
-                pass
-        self._compact_lines = []
+        # Historial completo en array('d'): crecimiento amortizado y cortes con paso en C
+        self.xdatos, self.ydatos = array("d"), array("d")
+        self._xmax_grafico = 30
         self.compact_ticks = []
-        self._legend_added = False
-
-        self.canvas_plot.draw()
+        self._redibujar_grafico()
 
     def _actualizar_grafico(self):
-        self.xdatos.append(self.sim.ahora)
-        self.ydatos.append(self.sim.uso_actual() * 100.0)
-        self.linea.set_data(self.xdatos, self.ydatos)
-        if self.xdatos:
-            self.ax.set_xlim(0, max(30, self.xdatos[-1]))
-        self.ax.set_ylim(0, 100)
-
-        # --- Redibujar marcadores de compactación ---
-        for ln in self._compact_lines:
-            try:
-                ln.remove()
-            except Exception:
-                pass
-        self._compact_lines = []
-        for i, t in enumerate(self.compact_ticks):
-            ln = self.ax.axvline(
-                x=t,
-                linestyle="--",
-                linewidth=1.2,
-                color="#f85149",
-                label="Compactación" if i == 0 and not self._legend_added else None
-            )
-            self._compact_lines.append(ln)
-        if self.compact_ticks and not self._legend_added:
-            leg = self.ax.legend(loc="upper left", frameon=True)
-            leg.get_frame().set_facecolor("#0f1115")
-            leg.get_frame().set_edgecolor("#30363d")
-            for txt in leg.get_texts():
-                txt.set_color("#e6edf3")
-            self._legend_added = True
-
-        self.canvas_plot.draw()
+        # Se sincroniza con el historial del simulador: entre repintados pueden
+        # haber pasado varios ticks y ninguno se pierde
+        hist = self.sim.hist_uso_pct
+        k, n = len(self.xdatos), len(hist)
+        if n > k:
+            self.xdatos.extend(range(k + 1, n + 1))
+            self.ydatos.extend([v * 100.0 for v in hist[k:]])
+        # La capa estática solo se rehace si cambia la escala (el eje x crece por saltos)
+        # o si hubo una compactación nueva (también antes del primer tick)
+        if n and self.xdatos[-1] > self._xmax_grafico:
+            self._xmax_grafico = max(30, int(self.xdatos[-1] * 1.5))
+            self._dibujar_ejes_grafico()
+        elif self._n_marcas != len(self.compact_ticks):
+            self._dibujar_ejes_grafico()
+        if n == 0:
+            return
+        self._trazar_linea()
+
+    def _redibujar_grafico(self):
+        self._dibujar_ejes_grafico()
+        self._trazar_linea()
+
+    @staticmethod
+    def _paso_ticks(xmax: int) -> int:
+        # Paso "redondo" (1, 2 o 5 x 10^k) para unas 6 marcas en el eje x
+        bruto = xmax / 6
+        base = 10 ** math.floor(math.log10(bruto)) if bruto >= 1 else 1
+        for m in (1, 2, 5, 10):
+            if m * base >= bruto:
+                return int(m * base)
+        return int(10 * base)
+
+    def _dibujar_ejes_grafico(self):
+        c = self.grafico
+        c.delete("ejes")
+        w, h = c.winfo_width(), c.winfo_height()
+        if w <= 1:
+            w, h = int(c["width"]), int(c["height"])  # todavía sin mapear
+        x0, y0, x1, y1 = 42, 26, w - 12, h - 30
+        self._area_grafico = (x0, y0, x1, y1)
+        fuente = ("Consolas", 8)
+
+        c.create_text((x0 + x1) / 2, y0 / 2, text="Uso de memoria/frames (%)", fill="#e6edf3",
+                      font=("Segoe UI", 10), tags="ejes")
+        for v in (0, 25, 50, 75, 100):
+            py = y1 - v / 100 * (y1 - y0)
+            c.create_line(x0, py, x1, py, fill="#1b2129", tags="ejes")
+            c.create_text(x0 - 6, py, text=str(v), anchor="e", fill="#9da7b3", font=fuente, tags="ejes")
+        xmax = self._xmax_grafico
+        for t in range(0, xmax + 1, self._paso_ticks(xmax)):
+            px = x0 + t / xmax * (x1 - x0)
+            c.create_text(px, y1 + 4, text=str(t), anchor="n", fill="#9da7b3", font=fuente, tags="ejes")
+        c.create_text((x0 + x1) / 2, h - 2, text="tick", anchor="s", fill="#9da7b3", font=fuente, tags="ejes")
+        c.create_rectangle(x0, y0, x1, y1, outline="#30363d", tags="ejes")
+
+        # Marcadores de compactación + leyenda
+        for t in self.compact_ticks:
+            px = x0 + t / xmax * (x1 - x0)
+            c.create_line(px, y0, px, y1, fill="#f85149", dash=(4, 2), tags="ejes")
+        if self.compact_ticks:
+            c.create_line(x0 + 8, y0 + 10, x0 + 26, y0 + 10, fill="#f85149", dash=(4, 2), tags="ejes")
+            c.create_text(x0 + 30, y0 + 10, text="Compactación", anchor="w", fill="#e6edf3",
+                          font=fuente, tags="ejes")
+        self._n_marcas = len(self.compact_ticks)
+        c.tag_raise(self._linea_id)
+
+    def _trazar_linea(self):
+        n = len(self.xdatos)
+        if n == 0:
+            self.grafico.coords(self._linea_id, -10, -10, -10, -10)
+            return
+        # Decimación por paso: la línea recibe ~MAX_PUNTOS_GRAFICO puntos sin importar
+        # el largo del historial (se agrega siempre el último punto)
+        paso = max(1, n // self.MAX_PUNTOS_GRAFICO)
+        xs, ys = self.xdatos[::paso], self.ydatos[::paso]
+        if (n - 1) % paso:
+            xs.append(self.xdatos[-1]); ys.append(self.ydatos[-1])
+        x0, y0, x1, y1 = self._area_grafico
+        sx = (x1 - x0) / self._xmax_grafico
+        sy = (y1 - y0) / 100.0
+        # Lista plana x0, y0, x1, y1, ... en píxeles (una sola llamada a coords)
+        pts = [v for x, y in zip(xs, ys) for v in (x0 + x * sx, y1 - y * sy)]
+        if n == 1:
+            pts *= 2  # create_line necesita al menos dos puntos
+        self.grafico.coords(self._linea_id, pts)
 
     def _resetear_vistas(self):
         self.lbl_titulo.config(text="Modo: -  |  t=0")
@@ -1127,9 +1505,8 @@ class Aplicacion(tk.Tk):
         self.lbl_block.config(text="[]")
         self.lbl_uso.config(text="Uso: 0%")
         self.lbl_extra.config(text="")
-        self.lienzo.delete("all")
-        for wdg in list(self.leyenda.children.values()):
-            wdg.destroy()
+        self._limpiar_lienzo()
+        self._mostrar_leyenda([])
         self._reiniciar_grafico()
 
     def _mostrar_resultados(self):
@@ -1180,6 +1557,24 @@ class Aplicacion(tk.Tk):
 # Inicio
 # ===========================
 
+def correr_escenarios_sin_interfaz():
+    # Mismos escenarios que los botones preconfigurados, sin GUI
+    escenarios = {
+        "CONTIGUA + Primer ajuste": dict(modo="CONTIGUA", asignador="primer"),
+        "CONTIGUA + Mejor ajuste": dict(modo="CONTIGUA", asignador="mejor"),
+        "PAGINACIÓN (sin reemplazo)": dict(modo="PAGINACION"),
+        "PAGINACIÓN + FIFO": dict(modo="PAGINACION", reemplazo_fifo=True),
+    }
+    for nombre, extra in escenarios.items():
+        sim = Simulador(memoria_total=1024, tamanio_pagina=64, quantum=3, ticks=150, stress=18, semilla=42, **extra)
+        # Límite de seguridad: sin reemplazo, la paginación puede quedar trabada
+        res = sim.ejecutar_rapido(limite=sim.ticks * 20)
+        print(f"{nombre} (t={sim.ahora}): {res}")
+
+
 if __name__ == "__main__":
-    app = Aplicacion()
-    app.mainloop()
+    if SIN_INTERFAZ:
+        correr_escenarios_sin_interfaz()
+    else:
+        app = Aplicacion()
+        app.mainloop()